@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+try:
+    from collections import OrderedDict
+except ImportError:  # NOCOV
+    from ordereddict import OrderedDict
+
+MAX_SIZE = 256
+
+FNV_OFFSET_BASIS = 0x811c9dc5
+FNV_PRIME = 0x01000193
+
+_cache = OrderedDict()
+
+# ``markdown2`` is imported on the first render; parsing RAML without
+# touching ``Content.html`` never pays for it.
+md = None
+
+
+def _fnv1a(s):
+    """
+    32-bit FNV-1a hash of ``s``.
+
+    :param str s: String to hash
+    :returns: ``int`` hash value
+    """
+    hash_ = FNV_OFFSET_BASIS
+    for c in s:
+        hash_ ^= ord(c)
+        hash_ = (hash_ * FNV_PRIME) & 0xFFFFFFFF
+    return hash_
+
+
+def get_or_render(data):
+    """
+    Return ``data`` rendered from Markdown into HTML, reusing a previous
+    rendering of the same source if one is still cached.
+
+    Entries are keyed by the FNV-1a hash of ``data``; the least recently
+    used entry is evicted once ``MAX_SIZE`` entries are held.
+
+    :param str data: Raw Markdown
+    :returns: ``str`` of HTML
+    """
+    key = _fnv1a(data)
+    cached = _cache.pop(key, None)
+    # guard against hash collisions by checking the source itself
+    if cached is not None and cached[0] == data:
+        _cache[key] = cached
+        return cached[1]
+
+    global md
+    if md is None:
+        import markdown2 as md
+    html = md.markdown(data)
+    _cache[key] = (data, html)
+    if len(_cache) > MAX_SIZE:
+        _cache.popitem(last=False)
+    return html
+
+
+def clear():
+    """Empty the render cache."""
+    _cache.clear()
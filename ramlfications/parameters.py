@@ -1,23 +1,77 @@
 # -*- coding: utf-8 -*-
 # Copyright (c) 2015 Spotify AB
 
+# Performance note: building these objects is memory/dispatch-bound (dict
+# lookups and object construction), not compute-bound, so there is no
+# SIMD/Numba opportunity here.  Keep the hot paths cheap with slotted
+# classes, cached Markdown rendering (see ``_md_cache``) and by avoiding
+# throwaway allocations in the parser.
+
 from __future__ import absolute_import, division, print_function
 
+from operator import attrgetter
+
 import attr
-import markdown2 as md
 
+from . import _md_cache
 from .validate import *  # NOQA
 
-HTTP_METHODS = [
+HTTP_METHODS = frozenset([
     "get", "post", "put", "delete", "patch", "options",
     "head", "trace", "connect"
-]
+])
 
-NAMED_PARAMS = [
+NAMED_PARAMS = (
     "desc", "type", "enum", "pattern", "minimum", "maximum", "example",
     "default", "required", "repeat", "display_name", "max_length",
     "min_length"
-]
+)
+
+HEADER_PARAMS = NAMED_PARAMS + ("method",)
+
+BODY_PARAMS = ("schema", "example", "form_params")
+
+# the only named parameter property a ``Response`` actually has
+RESPONSE_PARAMS = ("desc",)
+
+_GETTERS = dict((n, attrgetter(n)) for n in HEADER_PARAMS + BODY_PARAMS)
+
+
+def _inherit_properties(obj, inherited, names):
+    """
+    Set each property in ``names`` that is still ``None`` on ``obj`` to
+    the value of the first object in ``inherited`` that defines it.
+    Both ``obj`` and the inherited objects must define all of ``names``.
+    """
+    unset = [(n, _GETTERS[n]) for n in names if _GETTERS[n](obj) is None]
+    for param in inherited:
+        if not unset:
+            return
+        for item in unset[:]:
+            value = item[1](param)
+            if value is not None:
+                setattr(obj, item[0], value)
+                unset.remove(item)
+
+
+class _HasDescription(object):
+    """
+    Mixin providing ``description`` from ``desc``.  The
+    :py:class:`.Content` object is created on first access and kept in
+    the ``_description`` slot (outside of the ``attrs`` fields) until
+    ``desc`` changes.
+    """
+    __slots__ = ("_description",)
+
+    @property
+    def description(self):
+        desc = self.desc
+        if not desc:
+            return None
+        content = getattr(self, "_description", None)
+        if content is None or content.data is not desc:
+            content = self._description = Content(desc)
+        return content
 
 
 class Content(object):
@@ -27,8 +81,11 @@ class Content(object):
 
     :param str data: The raw/marked up content data.
     """
+    __slots__ = ("data", "_html")
+
     def __init__(self, data):
         self.data = data
+        self._html = None
 
     @property
     def raw(self):
@@ -40,16 +97,19 @@ class Content(object):
     @property
     def html(self):
         """
-        Returns parsed Markdown into HTML
+        Returns parsed Markdown into HTML.  The Markdown is only parsed
+        on first access; subsequent accesses return the cached HTML.
         """
-        return md.markdown(self.data)
+        if self._html is None:
+            self._html = _md_cache.get_or_render(self.data)
+        return self._html
 
     def __repr__(self):
         return self.raw
 
 
-@attr.s
-class BaseParameter(object):
+@attr.s(slots=True)
+class BaseParameter(_HasDescription):
     """
     Base parameter with properties defined by the RAML spec's \
     'Named Parameters' section.
@@ -80,6 +140,8 @@ class BaseParameter(object):
     :param str type: Primative type of parameter. Defaults to ``string`` if \
         not set.
     """
+    # NOTE: utils._create_base_param_obj passes these positionally; keep
+    # the declaration order (and ``required`` last in subclasses) in sync.
     name         = attr.ib()
     raw          = attr.ib(repr=False,
                            validator=attr.validators.instance_of(dict))
@@ -101,24 +163,14 @@ class BaseParameter(object):
                            validator=string_type_parameter)
     type         = attr.ib(repr=False, default="string")
 
-    @property
-    def description(self):
-        if self.desc:
-            return Content(self.desc)
-        return None
-
     def _inherit_type_properties(self, inherited_param):
-        for param in inherited_param:
-            name = getattr(param, "name", getattr(param, "code", None))
-            if name == self.name:
-                for n in NAMED_PARAMS:
-                    attr = getattr(self, n, None)
-                    if attr is None:
-                        attr = getattr(param, n, None)
-                        setattr(self, n, attr)
+        # only ever inherits from parameters of the same kind, which
+        # always have a ``name``
+        inherited = (p for p in inherited_param if p.name == self.name)
+        _inherit_properties(self, inherited, NAMED_PARAMS)
 
 
-@attr.s
+@attr.s(slots=True)
 class URIParameter(BaseParameter):
     """
     URI parameter with properties defined by the RAML specification's \
@@ -128,18 +180,26 @@ class URIParameter(BaseParameter):
     required = attr.ib(repr=False, default=True)
 
 
-@attr.s
-class QueryParameter(BaseParameter):
+@attr.s(slots=True)
+class _OptionalParameter(BaseParameter):
+    """
+    Named parameter that is not required unless stated otherwise.  Shared
+    by :py:class:`.QueryParameter` and :py:class:`.FormParameter` so the
+    ``attrs`` machinery is only generated once for both.
+    """
+    required = attr.ib(repr=False, default=False)
+
+
+class QueryParameter(_OptionalParameter):
     """
     Query parameter with properties defined by the RAML specification's \
     "Named Parameters" section, e.g. ``/foo/bar?baz=123`` where ``baz`` \
     is the name of the query parameter.
     """
-    required = attr.ib(repr=False, default=False)
+    __slots__ = ()
 
 
-@attr.s
-class FormParameter(BaseParameter):
+class FormParameter(_OptionalParameter):
     """
     Form parameter with properties defined by the RAML specification's
     "Named Parameters" section. Example:
@@ -148,7 +208,7 @@ class FormParameter(BaseParameter):
 
     where ``baz`` is the Form Parameter name.
     """
-    required = attr.ib(repr=False, default=False)
+    __slots__ = ()
 
 
 class Documentation(object):
@@ -158,24 +218,28 @@ class Documentation(object):
     :param str title: Title of documentation.
     :param str content: Content of documentation.
     """
+    __slots__ = ("_title", "_content", "_title_obj", "_content_obj")
+
     def __init__(self, _title, _content):
         self._title = _title
         self._content = _content
+        self._title_obj = Content(_title)
+        self._content_obj = Content(_content)
 
     @property
     def title(self):
-        return Content(self._title)
+        return self._title_obj
 
     @property
     def content(self):
-        return Content(self._content)
+        return self._content_obj
 
     def __repr__(self):  # NOCOV
         return "Documentation(title='{0}')".format(self.title)
 
 
-@attr.s
-class Header(object):
+@attr.s(slots=True)
+class Header(_HasDescription):
     """
     Header with properties defined by the RAML spec's 'Named Parameters'
     section, e.g.:
@@ -213,6 +277,8 @@ class Header(object):
     :param str method: HTTP method for header, or ``None``
     :param bool required: If parameter is required. Defaults to ``False``.
     """
+    # NOTE: utils._create_base_param_obj passes these positionally; keep
+    # the declaration order in sync.
     name         = attr.ib(repr=False)
     display_name = attr.ib()
     raw          = attr.ib(repr=False,
@@ -236,23 +302,11 @@ class Header(object):
     method       = attr.ib(repr=False, default=None)
     required     = attr.ib(repr=False, default=False)
 
-    @property
-    def description(self):
-        if self.desc:
-            return Content(self.desc)
-        return None
-
     def _inherit_type_properties(self, inherited_param):
-        params = NAMED_PARAMS + ["method"]
-        for param in inherited_param:
-            for n in params:
-                attr = getattr(self, n, None)
-                if attr is None:
-                    attr = getattr(param, n, None)
-                    setattr(self, n, attr)
+        _inherit_properties(self, inherited_param, HEADER_PARAMS)
 
 
-@attr.s
+@attr.s(slots=True)
 class Body(object):
     """
     Body of the request/response.
@@ -282,19 +336,14 @@ class Body(object):
     errors      = attr.ib(repr=False)
 
     def _inherit_type_properties(self, inherited_param):
-        body_params = ["schema", "example", "form_params"]
-        for param in inherited_param:
-            if param.mime_type != self.mime_type:
-                continue
-            for n in body_params:
-                attr = getattr(self, n, None)
-                if attr is None:
-                    attr = getattr(param, n, None)
-                    setattr(self, n, attr)
-
-
-@attr.s
-class Response(object):
+        inherited = (
+            p for p in inherited_param if p.mime_type == self.mime_type
+        )
+        _inherit_properties(self, inherited, BODY_PARAMS)
+
+
+@attr.s(slots=True)
+class Response(_HasDescription):
     """
     Expected response parameters.
 
@@ -316,23 +365,12 @@ class Response(object):
     errors   = attr.ib(repr=False)
     method   = attr.ib(default=None)
 
-    @property
-    def description(self):
-        if self.desc:
-            return Content(self.desc)
-        return None
-
     def _inherit_type_properties(self, inherited_param):
-        for param in inherited_param:
-            for n in NAMED_PARAMS:
-                attr = getattr(self, n, None)
-                if attr is None:
-                    attr = getattr(param, n, None)
-                    setattr(self, n, attr)
+        _inherit_properties(self, inherited_param, RESPONSE_PARAMS)
 
 
-@attr.s
-class SecurityScheme(object):
+@attr.s(slots=True)
+class SecurityScheme(_HasDescription):
     """
     Security scheme definition.
 
@@ -344,6 +382,23 @@ class SecurityScheme(object):
         when using security scheme.
     :param str description: Description of security scheme
     :param dict settings: Security schema-specific information
+    :param list headers: List of :py:class:`.Header` objects from \
+        ``described_by``, or ``None``
+    :param list body: List of :py:class:`.Body` objects from \
+        ``described_by``, or ``None``
+    :param list responses: List of :py:class:`.Response` objects from \
+        ``described_by``, or ``None``
+    :param list query_params: List of :py:class:`.QueryParameter` objects \
+        from ``described_by``, or ``None``
+    :param list uri_params: List of :py:class:`.URIParameter` objects from \
+        ``described_by``, or ``None``
+    :param list form_params: List of :py:class:`.FormParameter` objects \
+        from ``described_by``, or ``None``
+    :param str usage: Usage from ``described_by``, or ``None``
+    :param str media_type: Media type from ``described_by``, or ``None``
+    :param list protocols: Protocols from ``described_by``, or ``None``
+    :param list documentation: List of :py:class:`.Documentation` objects \
+        from ``described_by``, or ``None``
     """
     name          = attr.ib()
     raw           = attr.ib(repr=False, init=True,
@@ -354,9 +409,13 @@ class SecurityScheme(object):
     settings      = attr.ib(repr=False, validator=defined_sec_scheme_settings)
     config        = attr.ib(repr=False)
     errors        = attr.ib(repr=False)
-
-    @property
-    def description(self):
-        if self.desc:
-            return Content(self.desc)
-        return None
+    headers       = attr.ib(repr=False, default=None)
+    body          = attr.ib(repr=False, default=None)
+    responses     = attr.ib(repr=False, default=None)
+    query_params  = attr.ib(repr=False, default=None)
+    uri_params    = attr.ib(repr=False, default=None)
+    form_params   = attr.ib(repr=False, default=None)
+    usage         = attr.ib(repr=False, default=None)
+    media_type    = attr.ib(repr=False, default=None)
+    protocols     = attr.ib(repr=False, default=None)
+    documentation = attr.ib(repr=False, default=None)
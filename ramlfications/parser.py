@@ -3,13 +3,14 @@
 
 from __future__ import absolute_import, division, print_function
 import re
+from operator import attrgetter
 
 import attr
 from six import iteritems, iterkeys, itervalues
 
 
 from .config import MEDIA_TYPES
-from .errors import InvalidRAMLError
+from .errors import InvalidRAMLError, InvalidSecuritySchemeError
 from .parameters import (
     Documentation, Header, Body, Response, URIParameter, QueryParameter,
     FormParameter, SecurityScheme
@@ -149,35 +150,17 @@ def create_sec_schemes(raml_data, root):
     :param RootNode root: Root Node
     :returns: list of :py:class:`.parameters.SecurityScheme` objects
     """
-    def _map_object_types(item):
-        return {
-            "headers": headers,
-            "body": body,
-            "responses": responses,
-            "queryParameters": query_params,
-            "uriParameters": uri_params,
-            "formParameters": form_params,
-            "usage": usage,
-            "mediaType": media_type,
-            "protocols": protocols,
-            "documentation": documentation,
-        }[item]
-
     def headers(header_data):
-        _headers = []
         header_data = _get(header_data, "headers", {})
-        for k, v in list(iteritems(header_data)):
-            h = _create_base_param_obj({k: v},
-                                       Header,
-                                       root.config,
-                                       root.errors)
-            _headers.extend(h)
-        return _headers
+        return _create_base_param_obj(header_data,
+                                      Header,
+                                      root.config,
+                                      root.errors) or []
 
     def body(body_data):
         body_data = _get(body_data, "body", {})
         _body = []
-        for k, v in list(iteritems(body_data)):
+        for k, v in iteritems(body_data):
             body = Body(
                 mime_type=k,
                 raw=v,
@@ -193,51 +176,39 @@ def create_sec_schemes(raml_data, root):
     def responses(resp_data):
         _resps = []
         resp_data = _get(resp_data, "responses", {})
-        for k, v in list(iteritems(resp_data)):
+        for k, v in iteritems(resp_data):
             response = Response(
                 code=k,
                 raw=v,
                 desc=_get(v, "description"),
-                headers=headers(_get(v, "headers", {})),
-                body=body(_get(v, "body", {})),
+                headers=headers(v) if _get(v, "headers") else None,
+                body=body(v) if _get(v, "body") else None,
                 config=root.config,
                 errors=root.errors
             )
             _resps.append(response)
-        return sorted(_resps, key=lambda x: x.code)
+        return sorted(_resps, key=attrgetter("code"))
 
     def query_params(param_data):
         param_data = _get(param_data, "queryParameters", {})
-        _params = []
-        for k, v in list(iteritems(param_data)):
-            p = _create_base_param_obj({k: v},
-                                       QueryParameter,
-                                       root.config,
-                                       root.errors)
-            _params.extend(p)
-        return _params
+        return _create_base_param_obj(param_data,
+                                      QueryParameter,
+                                      root.config,
+                                      root.errors) or []
 
     def uri_params(param_data):
         param_data = _get(param_data, "uriParameters")
-        _params = []
-        for k, v in list(iteritems(param_data)):
-            p = _create_base_param_obj({k: v},
-                                       URIParameter,
-                                       root.config,
-                                       root.errors)
-            _params.extend(p)
-        return _params
+        return _create_base_param_obj(param_data,
+                                      URIParameter,
+                                      root.config,
+                                      root.errors) or []
 
     def form_params(param_data):
         param_data = _get(param_data, "formParameters", {})
-        _params = []
-        for k, v in list(iteritems(param_data)):
-            p = _create_base_param_obj({k: v},
-                                       FormParameter,
-                                       root.config,
-                                       root.errors)
-            _params.extend(p)
-        return _params
+        return _create_base_param_obj(param_data,
+                                      FormParameter,
+                                      root.config,
+                                      root.errors) or []
 
     def usage(desc_by_data):
         return _get(desc_by_data, "usage")
@@ -254,10 +225,19 @@ def create_sec_schemes(raml_data, root):
         docs = [Documentation(_get(i, "title"), _get(i, "content")) for i in d]
         return docs or None
 
-    def set_property(node, obj, node_data):
-        func = _map_object_types(obj)
-        item_objs = func({obj: node_data})
-        setattr(node, func.__name__, item_objs)
+    # describedBy key -> (SecurityScheme attribute, builder)
+    object_types = {
+        "headers": ("headers", headers),
+        "body": ("body", body),
+        "responses": ("responses", responses),
+        "queryParameters": ("query_params", query_params),
+        "uriParameters": ("uri_params", uri_params),
+        "formParameters": ("form_params", form_params),
+        "usage": ("usage", usage),
+        "mediaType": ("media_type", media_type),
+        "protocols": ("protocols", protocols),
+        "documentation": ("documentation", documentation),
+    }
 
     def initial_wrap(key, data):
         return SecurityScheme(
@@ -272,15 +252,21 @@ def create_sec_schemes(raml_data, root):
         )
 
     def final_wrap(node):
-        for obj, node_data in list(iteritems(node.described_by)):
-            set_property(node, obj, node_data)
+        for obj, node_data in iteritems(node.described_by):
+            handler = object_types.get(obj)
+            if handler is None:
+                msg = ("'{0}' is not a valid describedBy property of "
+                       "security scheme '{1}'.".format(obj, node.name))
+                root.errors.append(InvalidSecuritySchemeError(msg))
+                continue
+            attribute, func = handler
+            setattr(node, attribute, func({obj: node_data}))
         return node
 
     schemes = _get(raml_data, "securitySchemes", [])
     scheme_objs = []
     for s in schemes:
-        name = list(iterkeys(s))[0]
-        data = list(itervalues(s))[0]
+        name, data = next(iteritems(s))
         node = initial_wrap(name, data)
         node = final_wrap(node)
         scheme_objs.append(node)
@@ -319,7 +305,7 @@ def create_traits(raml_data, root):
     def body(data):
         body = _get(data, "body", {})
         body_objects = []
-        for key, value in list(iteritems(body)):
+        for key, value in iteritems(body):
             body = Body(
                 mime_type=key,
                 raw=value,
@@ -334,7 +320,7 @@ def create_traits(raml_data, root):
 
     def responses():
         response_objects = []
-        for key, value in list(iteritems(_get(data, "responses", {}))):
+        for key, value in iteritems(_get(data, "responses", {})):
             response = Response(
                 code=key,
                 raw=value,
@@ -345,7 +331,7 @@ def create_traits(raml_data, root):
                 errors=root.errors
             )
             response_objects.append(response)
-        return sorted(response_objects, key=lambda x: x.code) or None
+        return sorted(response_objects, key=attrgetter("code")) or None
 
     def wrap(key, data):
         return TraitNode(
@@ -414,7 +400,7 @@ def create_resource_types(raml_data, root):
                                         meth, v)
 
         body_objects = []
-        for key, value in list(iteritems(_body)):
+        for key, value in iteritems(_body):
             body = Body(
                 mime_type=key,
                 raw=value,
@@ -434,7 +420,7 @@ def create_resource_types(raml_data, root):
             _responses = _get_inherited_item(_responses, "responses",
                                              resource_types, meth, v)
 
-        for key, value in list(iteritems(_responses)):
+        for key, value in iteritems(_responses):
             _headers = _get(_get(data, "responses", {}), key, {})
             _headers = _get(_headers, "headers", {})
             header_objs = _create_base_param_obj(_headers, Header,
@@ -454,7 +440,7 @@ def create_resource_types(raml_data, root):
             )
             response_objects.append(response)
         if response_objects:
-            return sorted(response_objects, key=lambda x: x.code)
+            return sorted(response_objects, key=attrgetter("code"))
         return None
 
     def uri_params(data):
@@ -584,7 +570,7 @@ def create_resource_types(raml_data, root):
     child_res_type_names = []
 
     for res in resource_types:
-        for k, v in list(iteritems(res)):
+        for k, v in iteritems(res):
             if isinstance(v, dict):
                 if "type" in list(iterkeys(v)):
                     child_res_type_objects.append({k: v})
@@ -658,7 +644,7 @@ def create_resources(node, resources, root, parent):
     :param ResourceNode parent: Parent ``ResourceNode`` of current ``node``
     :returns: List of :py:class:`.raml.ResourceNode` objects.
     """
-    for k, v in list(iteritems(node)):
+    for k, v in iteritems(node):
         if k.startswith("/"):
             avail = _get(root.config, "http_optional")
             methods = [m for m in avail if m in list(iterkeys(v))]
@@ -784,7 +770,7 @@ def create_node(name, raw_data, method, parent, root):
                                                 method, is_())
 
         _body_objs = []
-        for k, v in list(iteritems(bodies)):
+        for k, v in iteritems(bodies):
             if v is None:
                 continue
             body = Body(
@@ -805,24 +791,27 @@ def create_node(name, raw_data, method, parent, root):
         """Set resource's expected responses."""
         def resp_headers(headers):
             """Set response headers."""
+            if not headers:
+                return None
             header_objs = []
-            for k, v in list(iteritems(headers)):
+            for k, v in iteritems(headers):
+                data = v if isinstance(v, dict) else {}
                 header = Header(
                     name=k,
-                    display_name=_get(v, "displayName", default=k),
+                    display_name=data.get("displayName", k),
                     method=method,
                     raw=headers,
-                    type=_get(v, "type", default="string"),
-                    desc=_get(v, "description"),
-                    example=_get(v, "example"),
-                    default=_get(v, "default"),
-                    minimum=_get(v, "minimum"),
-                    maximum=_get(v, "maximum"),
-                    min_length=_get(v, "minLength"),
-                    max_length=_get(v, "maxLength"),
-                    enum=_get(v, "enum"),
-                    repeat=_get(v, "repeat", default=False),
-                    pattern=_get(v, "pattern"),
+                    type=data.get("type", "string"),
+                    desc=data.get("description"),
+                    example=data.get("example"),
+                    default=data.get("default"),
+                    minimum=data.get("minimum"),
+                    maximum=data.get("maximum"),
+                    min_length=data.get("minLength"),
+                    max_length=data.get("maxLength"),
+                    enum=data.get("enum"),
+                    repeat=data.get("repeat", False),
+                    pattern=data.get("pattern"),
                     config=root.config,
                     errors=root.errors
                 )
@@ -831,6 +820,8 @@ def create_node(name, raw_data, method, parent, root):
 
         def resp_body(body):
             """Set response body."""
+            if not body:
+                return None
             body_list = []
             default_body = {}
             for (key, spec) in body.items():
@@ -879,19 +870,19 @@ def create_node(name, raw_data, method, parent, root):
         trait_resp = _get_trait("responses", root, is_())
         resp_objs = type_resp + trait_resp
         resp_codes = [r.code for r in resp_objs]
-        for k, v in list(iteritems(resps)):
+        for k, v in iteritems(resps):
             if k in resp_codes:
                 resp = [r for r in resp_objs if r.code == k][0]
                 index = resp_objs.index(resp)
                 inherit_resp = resp_objs.pop(index)
-                headers = resp_headers(_get(v, "headers", default={}))
+                headers = resp_headers(_get(v, "headers"))
                 if inherit_resp.headers:
                     headers = _remove_duplicates(inherit_resp.headers, headers)
                     # if headers:
                     #     headers.extend(inherit_resp.headers)
                     # else:
                     #     headers = inherit_resp.headers
-                body = resp_body(_get(v, "body", {}))
+                body = resp_body(_get(v, "body"))
                 if inherit_resp.body:
                     body = _remove_duplicates(inherit_resp.body, body)
                     # if body:
@@ -910,15 +901,13 @@ def create_node(name, raw_data, method, parent, root):
                 )
                 resp_objs.insert(index, resp)  # preserve order
             else:
-                _headers = _get(v, "headers", default={})
-                _body = _get(v, "body", default={})
                 resp = Response(
                     code=k,
                     raw={k: v},
                     method=method,
                     desc=_get(v, "description"),
-                    headers=resp_headers(_headers),
-                    body=resp_body(_body),
+                    headers=resp_headers(_get(v, "headers")),
+                    body=resp_body(_get(v, "body")),
                     config=root.config,
                     errors=root.errors
                 )
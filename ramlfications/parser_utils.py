@@ -4,7 +4,7 @@
 from __future__ import absolute_import, division, print_function
 
 
-from six import itervalues, iterkeys
+from six import iteritems
 
 from .parameters import SecurityScheme
 from .utils import _get_scheme
@@ -19,9 +19,9 @@ def security_schemes(secured, root):
         for item in secured:
             assigned_scheme = _get_scheme(item, root)
             if assigned_scheme:
-                raw_data = list(itervalues(assigned_scheme))[0]
+                name, raw_data = next(iteritems(assigned_scheme))
                 scheme = SecurityScheme(
-                    name=list(iterkeys(assigned_scheme))[0],
+                    name=name,
                     raw=raw_data,
                     type=raw_data.get("type"),
                     described_by=raw_data.get("describedBy"),
@@ -53,6 +53,10 @@ def load_schema(data):
 
     :param str data: schema/example data
     """
+    # most bodies define no schema/example; skip two failed parse attempts
+    if data is None:
+        return None
+
     try:
         return json.loads(data)
     except Exception:  # POKEMON!
@@ -231,36 +235,60 @@ def _get(data, item, default=None):
 
 def _create_base_param_obj(attribute_data, param_obj, config, errors, **kw):
     """Helper function to create a BaseParameter object"""
+    if not attribute_data:
+        return None
     objects = []
-
-    for key, value in list(iteritems(attribute_data)):
-        if param_obj is URIParameter:
-            required = _get(value, "required", default=True)
-        else:
-            required = _get(value, "required", default=False)
-        kwargs = dict(
-            name=key,
-            raw={key: value},
-            desc=_get(value, "description"),
-            display_name=_get(value, "displayName", key),
-            min_length=_get(value, "minLength"),
-            max_length=_get(value, "maxLength"),
-            minimum=_get(value, "minimum"),
-            maximum=_get(value, "maximum"),
-            default=_get(value, "default"),
-            enum=_get(value, "enum"),
-            example=_get(value, "example"),
-            required=required,
-            repeat=_get(value, "repeat", False),
-            pattern=_get(value, "pattern"),
-            type=_get(value, "type", "string"),
-            config=config,
-            errors=errors
-        )
+    # URI parameters are required unless stated otherwise
+    required_default = param_obj is URIParameter
+    method = kw.get("method")
+
+    # Parameters are instantiated positionally to skip building a kwargs
+    # dict per parameter; the argument order must follow the ``attr.ib``
+    # declaration order of ``Header`` and ``BaseParameter`` + subclasses.
+    for key, value in iteritems(attribute_data):
+        # normalize once so the lookups below are plain ``dict.get`` calls
+        data = value if isinstance(value, dict) else {}
         if param_obj is Header:
-            kwargs["method"] = _get(kw, "method")
-
-        item = param_obj(**kwargs)
+            item = Header(
+                key,                                # name
+                data.get("displayName", key),       # display_name
+                {key: value},                       # raw
+                data.get("description"),            # desc
+                data.get("example"),                # example
+                data.get("default"),                # default
+                data.get("minLength"),              # min_length
+                data.get("maxLength"),              # max_length
+                data.get("minimum"),                # minimum
+                data.get("maximum"),                # maximum
+                config,                             # config
+                errors,                             # errors
+                data.get("type", "string"),         # type
+                data.get("enum"),                   # enum
+                data.get("repeat", False),          # repeat
+                data.get("pattern"),                # pattern
+                method,                             # method
+                data.get("required", False),        # required
+            )
+        else:
+            item = param_obj(
+                key,                                # name
+                {key: value},                       # raw
+                data.get("description"),            # desc
+                data.get("displayName", key),       # display_name
+                data.get("minLength"),              # min_length
+                data.get("maxLength"),              # max_length
+                data.get("minimum"),                # minimum
+                data.get("maximum"),                # maximum
+                data.get("example"),                # example
+                data.get("default"),                # default
+                config,                             # config
+                errors,                             # errors
+                data.get("repeat", False),          # repeat
+                data.get("pattern"),                # pattern
+                data.get("enum"),                   # enum
+                data.get("type", "string"),         # type
+                data.get("required", required_default),  # required
+            )
         objects.append(item)
 
     return objects or None
@@ -280,7 +308,7 @@ def _map_param_unparsed_str_obj(param):
 # create_resource_types
 def _get_union(resource, method, inherited):
     union = {}
-    for key, value in list(iteritems(inherited)):
+    for key, value in iteritems(inherited):
         if resource.get(method) is not None:
             if key not in list(iterkeys(resource.get(method, {}))):
                 union[key] = value
@@ -290,7 +318,7 @@ def _get_union(resource, method, inherited):
                 union[key] = dict(list(iteritems(resource_values)) +
                                   list(iteritems(inherited_values)))
     if resource.get(method) is not None:
-        for key, value in list(iteritems(resource.get(method, {}))):
+        for key, value in iteritems(resource.get(method, {})):
             if key not in list(iterkeys(inherited)):
                 union[key] = value
     return union
@@ -358,7 +386,7 @@ def _get_inherited_resource(res_name, resource_types):
             return resource
 
 
-def _get_res_type_attribute(res_data, method_data, item, default={}):
+def _get_res_type_attribute(res_data, method_data, item, default=None):
     method_level = _get(method_data, item, default)
     resource_level = _get(res_data, item, default)
     return method_level, resource_level
@@ -556,9 +584,9 @@ def __root(item, **kwargs):
     return getattr(root, item, None)
 
 
-def get_inherited(item, inherit_from=[], **kwargs):
+def get_inherited(item, inherit_from=None, **kwargs):
     ret = {}
-    for nodetype in inherit_from:
+    for nodetype in inherit_from or []:
         inherit_func = _map_inheritance(nodetype)
         inherited = inherit_func(item, **kwargs)
         ret[nodetype] = inherited
@@ -682,10 +710,12 @@ def set_params(data, param_str, root, method, inherit=False, **kw):
 
 # preserve order of URI and Base URI parameters
 # used for RootNode, ResourceNode
-def _preserve_uri_order(path, param_objs, config, errors, declared=[]):
+def _preserve_uri_order(path, param_objs, config, errors, declared=None):
     # if this is hit, RAML shouldn't be valid anyways.
     if isinstance(path, list):
         path = path[0]
+    if declared is None:
+        declared = []
 
     sorted_params = []
     pattern = "\{(.*?)\}"
@@ -707,22 +737,21 @@ def _preserve_uri_order(path, param_objs, config, errors, declared=[]):
             # no need to create a URI param for version
             if m == "version":
                 continue
-            data = {"type": "string"}
             _param = URIParameter(name=m,
-                                  raw={m: data},
+                                  raw={m: {"type": "string"}},
                                   required=True,
                                   display_name=m,
-                                  desc=_get(data, "description"),
-                                  min_length=_get(data, "minLength"),
-                                  max_length=_get(data, "maxLength"),
-                                  minimum=_get(data, "minimum"),
-                                  maximum=_get(data, "maximum"),
-                                  default=_get(data, "default"),
-                                  enum=_get(data, "enum"),
-                                  example=_get(data, "example"),
-                                  repeat=_get(data, "repeat", False),
-                                  pattern=_get(data, "pattern"),
-                                  type=_get(data, "type", "string"),
+                                  desc=None,
+                                  min_length=None,
+                                  max_length=None,
+                                  minimum=None,
+                                  maximum=None,
+                                  default=None,
+                                  enum=None,
+                                  example=None,
+                                  repeat=False,
+                                  pattern=None,
+                                  type="string",
                                   config=config,
                                   errors=errors)
             param_objs.append(_param)
@@ -44,7 +44,7 @@ def find_meta(meta):
 
 def install_requires():
     install_requires = [
-        "attrs", "click", "jsonref", "markdown2", "pyyaml", "six",
+        "attrs>=16.0.0", "click", "jsonref", "markdown2", "pyyaml", "six",
         "termcolor", "xmltodict"
     ]
     if sys.version_info[:2] == (2, 6):
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ramlfications import _md_cache
+
+from .base import EXAMPLES
+
+
+@pytest.fixture
+def cache(request):
+    _md_cache.clear()
+    request.addfinalizer(_md_cache.clear)
+    return _md_cache
+
+
+@pytest.mark.parametrize("data,expected", [
+    ("", 0x811c9dc5),
+    ("a", 0xe40c292c),
+    ("foobar", 0xbf9cf968),
+])
+def test_fnv1a(data, expected):
+    assert _md_cache._fnv1a(data) == expected
+
+
+def test_get_or_render(cache):
+    html = cache.get_or_render("*foo*")
+    assert html == "<p><em>foo</em></p>\n"
+    assert cache.get_or_render("*foo*") is html
+    assert len(cache._cache) == 1
+
+
+def test_get_or_render_collision(cache):
+    key = cache._fnv1a("*foo*")
+    cache._cache[key] = ("*bar*", "<p><em>bar</em></p>\n")
+    assert cache.get_or_render("*foo*") == "<p><em>foo</em></p>\n"
+
+
+def test_get_or_render_evicts_oldest(cache, monkeypatch):
+    monkeypatch.setattr(cache, "MAX_SIZE", 2)
+    cache.get_or_render("one")
+    cache.get_or_render("two")
+    cache.get_or_render("one")
+    cache.get_or_render("three")
+
+    cached = [v[0] for v in cache._cache.values()]
+    assert cached == ["one", "three"]
+
+
+LAZY_IMPORT_SCRIPT = """
+import sys
+
+import ramlfications
+
+api = ramlfications.parse({raml!r}, {config!r})
+assert "markdown2" not in sys.modules, "imported by parse()"
+
+html = api.documentation[0].title.html
+assert html == "<p>Example Web API Docs</p>\\n", html
+assert "markdown2" in sys.modules
+"""
+
+
+def test_markdown2_imported_lazily():
+    # run in a fresh interpreter; other tests will have imported markdown2
+    script = LAZY_IMPORT_SCRIPT.format(
+        raml=os.path.join(EXAMPLES, "complete-valid-example.raml"),
+        config=os.path.join(EXAMPLES, "test-config.ini"))
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.Popen([sys.executable, "-c", script], cwd=cwd,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, err = proc.communicate()
+    assert proc.returncode == 0, err.decode("utf-8")
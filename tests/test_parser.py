@@ -4,12 +4,15 @@ from __future__ import absolute_import, division, print_function
 
 import os
 
+import attr
 import pytest
 import xmltodict
 
 from ramlfications import parser as pw
 from ramlfications.config import setup_config
+from ramlfications.parameters import QueryParameter
 from ramlfications.raml import RootNode, ResourceTypeNode, TraitNode
+from ramlfications.utils import _create_base_param_obj
 from ramlfications._helpers import load_file
 
 from .base import EXAMPLES
@@ -69,6 +72,11 @@ def test_docs(root):
     assert title_html == root.documentation[0].title.html
     assert content_html == root.documentation[0].content.html
 
+    # content objects and their rendered HTML are created once
+    doc = root.documentation[0]
+    assert doc.title is doc.title
+    assert doc.content.html is doc.content.html
+
 
 def test_base_uri_params(root):
     exp_name = "subdomain"
@@ -208,6 +216,8 @@ def test_create_security_schemes(sec_schemes):
             "token or\nthe access token has expired. You should "
             "re-authenticate the user.\n")
     assert sec_schemes[0].responses[0].description.raw == desc
+    assert sec_schemes[0].responses[0].headers is None
+    assert sec_schemes[0].responses[0].body is None
 
     assert sec_schemes[0].responses[1].code == 403
 
@@ -216,6 +226,18 @@ def test_create_security_schemes(sec_schemes):
             "help here.\n")
     assert sec_schemes[0].responses[1].description.raw == desc
 
+    resp_headers = sec_schemes[0].responses[1].headers
+    assert len(resp_headers) == 1
+    assert resp_headers[0].name == "WWW-Authenticate"
+    assert resp_headers[0].type == "string"
+    desc = "The authentication error that occurred"
+    assert resp_headers[0].description.raw == desc
+
+    resp_body = sec_schemes[0].responses[1].body
+    assert len(resp_body) == 1
+    assert resp_body[0].mime_type == "application/json"
+    assert resp_body[0].example == {"error": "invalid_request"}
+
     settings = {
         "authorizationUri": "https://accounts.example.com/authorize",
         "accessTokenUri": "https://accounts.example.com/api/token",
@@ -291,6 +313,37 @@ def test_trait_headers(traits):
     assert trait.headers[0].description.raw == "An example of a trait header"
     html_desc = "<p>An example of a trait header</p>\n"
     assert trait.headers[0].description.html == html_desc
+    assert trait.headers[0].description is trait.headers[0].description
+
+
+def test_description_cache_not_an_attrs_field(root):
+    params = _create_base_param_obj({"foo": {"description": "Foo"}},
+                                    QueryParameter, root.config, [])
+    param = params[0]
+    assert param.description.raw == "Foo"
+
+    assert "_description" not in [a.name for a in attr.fields(QueryParameter)]
+    assert "_description" not in attr.asdict(param)
+
+
+def test_description_rebuilt_when_desc_changes(root):
+    params = _create_base_param_obj({"foo": {"description": "Foo"}},
+                                    QueryParameter, root.config, [])
+    param = params[0]
+    first = param.description
+    assert first.raw == "Foo"
+
+    # desc cleared and then filled in from the resource type
+    inherited = _create_base_param_obj(
+        {"foo": {"description": "Inherited foo"}},
+        QueryParameter, root.config, [])
+    param.desc = None
+    assert param.description is None
+    param._inherit_type_properties(inherited)
+    assert param.desc == "Inherited foo"
+    assert param.description is not first
+    assert param.description.raw == "Inherited foo"
+    assert param.description is param.description
 
 
 def test_trait_body(traits):
@@ -545,7 +598,19 @@ def test_resource_type_secured_by(resource_types):
                 "description": ("Bad OAuth request (wrong consumer key, bad "
                                 "nonce, expired\ntimestamp...). Unfortunately,"
                                 " re-authenticating the user won't help "
-                                "here.\n")
+                                "here.\n"),
+                "headers": {
+                    "WWW-Authenticate": {
+                        "description": ("The authentication error that "
+                                        "occurred"),
+                        "type": "string"
+                    }
+                },
+                "body": {
+                    "application/json": {
+                        "example": '{"error": "invalid_request"}'
+                    }
+                }
             }
         }
     }
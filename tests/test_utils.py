@@ -202,3 +202,13 @@ def test_save_updated_mime_types():
     assert result == content
 
     os.remove(temp_output)
+
+
+@pytest.mark.parametrize("data,expected", [
+    (None, None),
+    ('{"foo": "bar"}', {"foo": "bar"}),
+    ("<foo>bar</foo>", {"foo": "bar"}),
+    ("not a schema", "not a schema"),
+])
+def test_load_schema(data, expected):
+    assert utils.load_schema(data) == expected
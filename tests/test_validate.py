@@ -385,3 +385,16 @@ def test_empty_mapping_sec_scheme_settings():
            "definition.",)
     assert _error_exists(e.value.errors, errors.InvalidSecuritySchemeError,
                          msg)
+
+
+def test_invalid_sec_scheme_described_by():
+    _raml = "invalid-security-scheme-described-by.raml"
+    raml = load_raml(_raml)
+    config = load_config("valid-config.ini")
+    with raises as e:
+        validate(raml, config)
+    msg = ("'fooBar' is not a valid describedBy property of security "
+           "scheme 'CustomScheme'.",)
+    assert _error_exists(e.value.errors, errors.InvalidSecuritySchemeError,
+                         msg)
+    assert len(e.value.errors) == 1